@@ -16,6 +16,7 @@ cdef class Interval(object):
     cdef object _split_line
     cdef public int nfields
     cdef public str other_attributes
+    cdef public int source
 
     # methods
     cpdef int midpoint(self)
@@ -0,0 +1,107 @@
+
+from heapq import heappush, heappop, heapreplace
+
+cdef class MergedIterator(object):
+    cdef public object sources
+    cdef public int nsources
+    cdef public object chrom_order
+    cdef object _rank
+    cdef list _heap
+    cdef list _last
+
+    def __init__(self, sources, chrom_order=None):
+        """
+        Lazily merges several coordinate-sorted *sources* (e.g.,
+        [BAMFile(fn1), BAMFile(fn2)]) into a single stream of features sorted
+        by (chrom, start), so that replicates can be fed to a Window without
+        first merging them on disk.
+
+        Each feature that comes out has its *source* attribute set to the
+        index of the source it came from.
+
+        *chrom_order* is a list of chromosome names giving the order the
+        sources are sorted in.  If None, the header order of any BAM/SAM
+        sources is used (they must all agree); if there are no such sources,
+        chromosomes are assumed to be sorted by byte order, as with
+        `LC_ALL=C sort -k1,1 -k2,2n`.
+
+        Only one feature per source is held in memory at a time.  If a source
+        turns out to be unsorted, ValueError is raised and the iterator is
+        then exhausted.
+        """
+        self.sources = list(sources)
+        self.nsources = len(self.sources)
+
+        if chrom_order is None:
+            for source in self.sources:
+                references = getattr(source, 'references', None)
+                if references is None:
+                    continue
+                if chrom_order is None:
+                    chrom_order = references
+                elif tuple(references) != tuple(chrom_order):
+                    raise ValueError, 'sources have different chromosome orders; please specify chrom_order'
+        self.chrom_order = chrom_order
+
+        if chrom_order is None:
+            self._rank = None
+        else:
+            self._rank = dict((chrom, i) for i, chrom in enumerate(chrom_order))
+
+        # The heap holds one (chrom key, start, source index, feature) tuple
+        # per non-exhausted source.  The source index is unique within the
+        # heap, so features themselves never get compared.
+        self._heap = []
+        self._last = [None] * self.nsources
+        for i, source in enumerate(self.sources):
+            try:
+                feature = source.next()
+            except StopIteration:
+                continue
+            heappush(self._heap, self._entry(feature, i))
+
+    cdef object _entry(self, object feature, int i):
+        """
+        Tag *feature* with source index *i* and build its heap entry, checking
+        that source *i* is actually sorted.
+        """
+        cdef object key
+        if self._rank is None:
+            key = feature.chrom
+        else:
+            try:
+                key = self._rank[feature.chrom]
+            except KeyError:
+                raise ValueError, 'chromosome "%s" in source %s is not in chrom_order' % (feature.chrom, i)
+        entry = (key, feature.start, i, feature)
+        last = self._last[i]
+        if last is not None and entry[:2] < last:
+            raise ValueError, 'source %s is not sorted: %s:%s comes after %s' % (i, feature.chrom, feature.start, last)
+        self._last[i] = entry[:2]
+        feature.source = i
+        return entry
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef int i
+        if not self._heap:
+            raise StopIteration
+        i = self._heap[0][2]
+        feature = self._heap[0][3]
+
+        # Replace the outgoing entry with the next one from the same source,
+        # or drop it if that source is exhausted.  If the next one is invalid,
+        # give up on the whole merge rather than leave the outgoing entry on
+        # the heap to be returned again.
+        try:
+            entry = self._entry(self.sources[i].next(), i)
+        except StopIteration:
+            heappop(self._heap)
+            return feature
+        except ValueError:
+            self._heap = []
+            raise
+        heapreplace(self._heap, entry)
+        return feature
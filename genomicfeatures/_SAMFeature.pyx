@@ -66,6 +66,14 @@ cdef class SAMFile(object):
     def __init__(self, str fn):
         self._handle = pysam.Samfile(fn)
     
+    property references:
+        """
+        Tuple of chromosome names in the order they appear in the header,
+        which is the order a coordinate-sorted file is sorted in.
+        """
+        def __get__(self):
+            return self._handle.references
+
     def __iter__(self):
         return self
 
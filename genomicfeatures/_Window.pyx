@@ -16,13 +16,21 @@ cdef class Window(object):
     cdef public int debug
     cdef public object buffered_read
     cdef int START
+    cdef public int nsources
+    cdef public object source_counts
 
-    def __init__(self, iterable, windowsize=100, debug=0):
+    def __init__(self, iterable, windowsize=100, debug=0, count_sources=False):
         """
         Moving window over an *iterable* of features (e.g., BAMFile(bamfn)) of
         size *windowsize*.  Use *debug=1* to see all sorts of output for
         double-checking.
 
+        *iterable* can also be a MergedIterator over several sorted files.  In
+        that case, use *count_sources=True* to keep a running count of how
+        many reads in the window came from each source; each iteration then
+        returns a 4-tuple whose last item is the *source_counts* list.  Any
+        other iterable is treated as a single source.
+
         The resulting Window instance can be iterated over.  Each iteration
         returns a tuple of::
 
@@ -53,6 +61,12 @@ cdef class Window(object):
         self.left_edge = 0
         self.right_edge = 0
         self.debug = debug
+        if count_sources:
+            self.nsources = getattr(iterable, 'nsources', 1)
+            self.source_counts = [0] * self.nsources
+        else:
+            self.nsources = 0
+            self.source_counts = None
 
         # Here we pull the first thing from the iterable to set up the various
         # attributes
@@ -65,6 +79,8 @@ cdef class Window(object):
         self.buffered_read = first_read
         self.high_reads = deque()
         self.low_reads = deque([self.buffered_read])
+        if self.nsources:
+            self.source_counts[first_read.source] += 1
         self.START = 1
 
     cdef int accumulate_reads(self) except -1:
@@ -110,6 +126,11 @@ cdef class Window(object):
             else:
                 break
 
+            # Reads only enter the window through here, so this is the one
+            # place to count them in
+            if self.nsources:
+                self.source_counts[self.buffered_read.source] += 1
+
             # The positioning of this is important -- we only get a new
             # buffered read if the last buffered read has been treated --
             # either added to low_reads or high_reads
@@ -155,6 +176,8 @@ cdef class Window(object):
                 if (popped.start < self.left_edge) or (popped.chrom != self.buffered_read.chrom):
                     if self.debug:
                         print popped.start,
+                    if self.nsources:
+                        self.source_counts[popped.source] -= 1
                     continue
                 else:
                     self.low_reads.appendleft(popped)
@@ -205,7 +228,11 @@ cdef class Window(object):
             print 'low contents :', [i.start for i in self.low_reads]
             print 'high contents:', [i.start for i in self.high_reads]
             print 'buffer       :', self.buffered_read.start
+            if self.nsources:
+                print 'sources      :', self.source_counts
 
+        if self.nsources:
+            return self.center, self.low_reads, self.high_reads, self.source_counts
         return self.center, self.low_reads, self.high_reads
 
 
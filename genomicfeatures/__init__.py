@@ -4,9 +4,11 @@ from _BEDFeature import BEDFeature, BEDFile
 from _SAMFeature import SAMFeature, SAMFile, BAMFile
 #from _Scores import dups_score, dups_score_sum
 from _Window import Window
+from _Merged import MergedIterator
 from _Scores import dups_score
 from _Counter import Counter
 from test_window import test_window
+from test_merged import test_merged
 
 
 def inspect_fields(line):
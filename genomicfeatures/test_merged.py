@@ -0,0 +1,61 @@
+import genomicfeatures
+import os
+import tempfile
+
+def _write_bed(lines):
+    fd, fn = tempfile.mkstemp(suffix='.bed')
+    fout = os.fdopen(fd, 'w')
+    fout.writelines(lines)
+    fout.close()
+    return fn
+
+def test_merged():
+    bed_fn = os.path.join(os.path.dirname(__file__), '../timing/window_example.bed')
+    lines = open(bed_fn).readlines()
+
+    # Every other line into each of two sources keeps both of them sorted
+    nsources = 2
+    split = [lines[i::nsources] for i in range(nsources)]
+    fns = [_write_bed(i) for i in split]
+
+    try:
+        # Merged order should match a sorted concatenation of the inputs, with
+        # each feature tagged by the source it came from
+        expected = []
+        for i, source_lines in enumerate(split):
+            for line in source_lines:
+                fields = line.split('\t')
+                expected.append((fields[0], int(fields[1]), i))
+        expected.sort()
+        merged = genomicfeatures.MergedIterator([genomicfeatures.BEDFile(fn) for fn in fns])
+        observed = [(f.chrom, f.start, f.source) for f in merged]
+        assert [i[:2] for i in observed] == [i[:2] for i in expected], observed
+        assert sorted(observed) == expected, observed
+
+        # Running per-source counts should always match what's in the window
+        merged = genomicfeatures.MergedIterator([genomicfeatures.BEDFile(fn) for fn in fns])
+        w = genomicfeatures.Window(merged, windowsize=100, count_sources=True)
+        c = 0
+        for center, low_reads, high_reads, source_counts in w:
+            c += 1
+            tally = [0] * nsources
+            for read in low_reads:
+                tally[read.source] += 1
+            for read in high_reads:
+                tally[read.source] += 1
+            assert source_counts == tally, (center, source_counts, tally)
+        assert c > 0
+
+        # An unsorted source should be caught
+        unsorted_fn = _write_bed(list(reversed(split[0])))
+        fns.append(unsorted_fn)
+        merged = genomicfeatures.MergedIterator([genomicfeatures.BEDFile(unsorted_fn)])
+        try:
+            list(merged)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError, 'unsorted source did not raise ValueError'
+    finally:
+        for fn in fns:
+            os.unlink(fn)